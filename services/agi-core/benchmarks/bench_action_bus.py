@@ -0,0 +1,154 @@
+"""
+Benchmark: direct vs bus-coalesced action dispatch
+
+Simulates many agents acting concurrently against three downstream systems.
+Pricing agents push adjustments for a handful of product groups (later ones
+supersede earlier ones) and risk agents repeatedly request the same credit and
+failover mitigations (identical requests are deduplicated). Each downstream call
+costs a fixed round trip plus a small per-action cost, and each system accepts
+a limited number of concurrent connections.
+
+Reports actions/sec and downstream calls for direct dispatch (one call per
+action) and for the ActionBus.
+
+Run from services/agi-core:
+    python benchmarks/bench_action_bus.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_framework import (  # noqa: E402
+    ActionBus,
+    ActionExecutor,
+    ActionRequest,
+    DynamicPricingAgent,
+    RiskAssessmentAgent,
+)
+
+ROUNDS = 20
+PRICING_AGENTS = 200
+RISK_AGENTS = 50
+PRODUCT_GROUPS = [['electronics'], ['apparel'], ['grocery'], ['home', 'garden'], ['all']]
+CALL_LATENCY = 0.002
+PER_ACTION_COST = 0.00005
+CONNECTIONS_PER_SYSTEM = 8
+
+
+class RemoteExecutor(ActionExecutor):
+    """Downstream system with a fixed per-call round trip and a connection limit"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = 0
+        self.applied: List[ActionRequest] = []
+        self.connections = asyncio.Semaphore(CONNECTIONS_PER_SYSTEM)
+
+    async def execute_batch(self, requests: List[ActionRequest]) -> List[Dict[str, Any]]:
+        async with self.connections:
+            self.calls += 1
+            await asyncio.sleep(CALL_LATENCY + PER_ACTION_COST * len(requests))
+            self.applied.extend(requests)
+        return [self.handler(request.action_type, request.parameters) for request in requests]
+
+
+def make_executors() -> Dict[str, RemoteExecutor]:
+    return {
+        'pricing_system': RemoteExecutor(DynamicPricingAgent.apply_pricing_action),
+        'credit_policy': RemoteExecutor(RiskAssessmentAgent.apply_risk_mitigation),
+        'infrastructure': RemoteExecutor(RiskAssessmentAgent.apply_risk_mitigation),
+    }
+
+
+def make_round(rng: np.random.Generator) -> List[ActionRequest]:
+    requests = []
+    for i in range(PRICING_AGENTS):
+        products = PRODUCT_GROUPS[rng.integers(len(PRODUCT_GROUPS))]
+        requests.append(ActionRequest(
+            target='pricing_system',
+            action_type='adjust_pricing',
+            parameters={
+                'price_adjustment_percent': float(rng.normal(0, 0.03)),
+                'affected_products': products,
+                'duration_hours': 24
+            },
+            agent_id=f"pricing_agent_{i:03d}",
+            coalesce_key=f"adjust_pricing:{','.join(sorted(products))}"
+        ))
+    for i in range(RISK_AGENTS):
+        if rng.random() < 0.7:
+            target, action_type, parameters = 'credit_policy', 'tighten_credit_policy', {
+                'min_credit_score': 750, 'max_debt_to_income': 0.3, 'additional_verification': True}
+        else:
+            target, action_type, parameters = 'infrastructure', 'activate_backup_systems', {
+                'backup_region': 'us-east-1', 'failover_threshold': 0.98, 'monitoring_frequency': '1min'}
+        requests.append(ActionRequest(
+            target=target,
+            action_type=action_type,
+            parameters=parameters,
+            agent_id=f"risk_agent_{i:03d}",
+            coalesce_key=action_type
+        ))
+    rng.shuffle(requests)
+    return requests
+
+
+async def run_direct(rounds: List[List[ActionRequest]]) -> Dict[str, Any]:
+    executors = make_executors()
+    start = time.perf_counter()
+    for requests in rounds:
+        await asyncio.gather(*(executors[r.target].execute_batch([r]) for r in requests))
+    elapsed = time.perf_counter() - start
+    return {'elapsed': elapsed, 'calls': sum(e.calls for e in executors.values())}
+
+
+async def run_bus(rounds: List[List[ActionRequest]]) -> Dict[str, Any]:
+    executors = make_executors()
+    bus = ActionBus(batch_window=0.005)
+    for target, executor in executors.items():
+        bus.register_executor(target, executor)
+
+    start = time.perf_counter()
+    for requests in rounds:
+        await asyncio.gather(*(bus.submit(request) for request in requests))
+    elapsed = time.perf_counter() - start
+
+    # Latest adjustment per product group must be the one applied
+    last_round = rounds[-1]
+    expected = {}
+    for request in last_round:
+        if request.target == 'pricing_system':
+            expected[request.coalesce_key] = request.request_id
+    applied = {r.coalesce_key: r.request_id for r in executors['pricing_system'].applied[-len(expected):]}
+    assert applied == expected, "coalescing did not keep the latest adjustment"
+
+    return {'elapsed': elapsed, 'calls': sum(e.calls for e in executors.values()), 'stats': bus.stats}
+
+
+async def main() -> None:
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(11)
+    rounds = [make_round(rng) for _ in range(ROUNDS)]
+    total_actions = sum(len(r) for r in rounds)
+
+    direct = await run_direct(rounds)
+    batched = await run_bus(rounds)
+
+    print(f"{total_actions:,} actions over {ROUNDS} rounds of {PRICING_AGENTS + RISK_AGENTS} agents")
+    print(f"{'':<10}{'actions/s':>12}{'downstream calls':>18}")
+    for label, result in (("direct", direct), ("bus", batched)):
+        print(f"{label:<10}{total_actions / result['elapsed']:>12,.0f}{result['calls']:>18,}")
+    print(f"downstream call reduction: {1 - batched['calls'] / direct['calls']:.1%}")
+    print(f"bus stats: {batched['stats']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+"""
+Benchmark: fixed vs adaptive agent scheduling
+
+Simulates a day of orchestration at one-second resolution by driving
+AgentOrchestrator._execute_scheduled_agents with a virtual clock, so shedding,
+loop-lag handling and the status bookkeeping are the orchestrator's own.
+Threat episodes hit the market at random times and an overload window pushes
+event-loop lag past the shedding threshold. For each policy we report the total
+number of OODA cycles executed (work done) and how long each agent took to
+notice a threat after it started (responsiveness).
+
+Run from services/agi-core:
+    python benchmarks/bench_adaptive_scheduling.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_framework import (  # noqa: E402
+    AdaptiveSchedulingPolicy,
+    AgentOrchestrator,
+    AgentPriority,
+    AgentStatus,
+    OODAAgent,
+    Situation,
+)
+
+SIMULATED_SECONDS = 24 * 3600
+THREAT_EPISODES = 12
+THREAT_DURATION = 15 * 60
+OVERLOAD_WINDOW = (12 * 3600, 13 * 3600)
+OVERLOAD_LAG = 1.5
+
+
+class VirtualClock:
+    """Simulation time handed to the orchestrator in place of datetime.now"""
+
+    def __init__(self, epoch: datetime):
+        self.epoch = epoch
+        self.second = 0
+
+    def __call__(self) -> datetime:
+        return self.epoch + timedelta(seconds=self.second)
+
+
+class SimulatedAgent(OODAAgent):
+    """Agent whose OODA outcome is dictated by the simulation timeline"""
+
+    def __init__(self, agent_id: str, priority: AgentPriority, clock: VirtualClock, threatened: np.ndarray):
+        super().__init__(agent_id, agent_id, "benchmark", sensors=[], memory=None, priority=priority)
+        self.clock = clock
+        self.threatened = threatened
+        self.cycles: List[int] = []
+
+    async def run_ooda_loop(self) -> None:
+        second = self.clock.second
+        self.cycles.append(second)
+        self.status = AgentStatus.ACTIVE
+        self.last_decision = None
+        self.last_situation = Situation(
+            timestamp=self.clock(),
+            observations=[],
+            context={},
+            threats=["high_market_volatility"] if self.threatened[second] else []
+        )
+
+    async def orient(self, observations):
+        raise NotImplementedError
+
+    async def decide(self, situation):
+        raise NotImplementedError
+
+    async def act(self, decision):
+        raise NotImplementedError
+
+
+def build_threat_timeline(rng: np.random.Generator) -> List[int]:
+    starts = rng.choice(SIMULATED_SECONDS - THREAT_DURATION, size=THREAT_EPISODES, replace=False)
+    return sorted(int(s) for s in starts)
+
+
+async def simulate(policy: Optional[AdaptiveSchedulingPolicy], threat_starts: List[int]) -> Dict[str, Dict]:
+    """Drive AgentOrchestrator._execute_scheduled_agents once per virtual second"""
+    threatened = np.zeros(SIMULATED_SECONDS, dtype=bool)
+    for start in threat_starts:
+        threatened[start:start + THREAT_DURATION] = True
+
+    clock = VirtualClock(datetime(2024, 1, 1))
+    orchestrator = AgentOrchestrator(redis_client=None, db_engine=None, scheduling_policy=policy, clock=clock)
+    agents = [
+        (SimulatedAgent("risk_agent", AgentPriority.CRITICAL, clock, threatened), 600),
+        (SimulatedAgent("pricing_agent", AgentPriority.HIGH, clock, threatened), 300),
+        (SimulatedAgent("reporting_agent", AgentPriority.LOW, clock, threatened), 120),
+    ]
+    for agent, interval in agents:
+        orchestrator.register_agent(agent, schedule_interval=interval)
+
+    shed_ticks = {agent.agent_id: 0 for agent, _ in agents}
+    for second in range(SIMULATED_SECONDS):
+        clock.second = second
+        in_overload = OVERLOAD_WINDOW[0] <= second < OVERLOAD_WINDOW[1]
+        orchestrator.loop_lag = OVERLOAD_LAG if in_overload else 0.0
+
+        await orchestrator._execute_scheduled_agents()
+        # Let the spawned agent tasks finish and run the orchestrator's bookkeeping
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        for agent_id, status in orchestrator.get_agent_status().items():
+            shed_ticks[agent_id] += int(status['shed'])
+
+    results = {}
+    for agent, _ in agents:
+        cycles = np.array(agent.cycles)
+        latencies = []
+        for start in threat_starts:
+            # First cycle that ran while this threat episode was active
+            hits = cycles[(cycles >= start) & (cycles < start + THREAT_DURATION)]
+            if hits.size:
+                latencies.append(int(hits[0]) - start)
+        results[agent.agent_id] = {
+            'executions': len(cycles),
+            'threat_cycles': int(threatened[cycles].sum()) if cycles.size else 0,
+            'shed': shed_ticks[agent.agent_id],
+            'latencies': latencies,
+            'missed': len(threat_starts) - len(latencies),
+        }
+    return results
+
+
+def report(label: str, results: Dict[str, Dict]) -> None:
+    print(f"\n{label}")
+    print(f"{'agent':<18}{'cycles':>8}{'in threat':>11}{'shed ticks':>12}"
+          f"{'mean detect (s)':>18}{'p95 detect (s)':>17}{'missed':>8}")
+    total = 0
+    for agent_id, stats in results.items():
+        latencies = np.array(stats['latencies'] or [np.nan], dtype=float)
+        total += stats['executions']
+        print(f"{agent_id:<18}{stats['executions']:>8}{stats['threat_cycles']:>11}{stats['shed']:>12}"
+              f"{np.nanmean(latencies):>18.1f}{np.nanpercentile(latencies, 95):>17.1f}{stats['missed']:>8}")
+    print(f"{'total cycles':<18}{total:>8}")
+
+
+async def main() -> None:
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(42)
+    threat_starts = build_threat_timeline(rng)
+
+    report("Fixed intervals", await simulate(None, threat_starts))
+    # Real load average is irrelevant to the simulation; only the injected loop lag sheds work
+    policy = AdaptiveSchedulingPolicy(max_cpu_load=float('inf'))
+    report("Adaptive intervals", await simulate(policy, threat_starts))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
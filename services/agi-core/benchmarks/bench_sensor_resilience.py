@@ -0,0 +1,137 @@
+"""
+Benchmark: observe-phase tail latency with and without sensor resilience
+
+Runs repeated observe phases over a market data sensor (three symbols) and a
+customer behavior sensor backed by fake upstreams:
+  - AAPL and the analytics API are healthy with a small slow tail,
+  - MSFT occasionally stalls for a long time,
+  - GOOGL fails outright for the middle third of the run.
+Reports p50/p95/p99 observe latency, observation counts and how many results
+were stale fallbacks.
+
+Run from services/agi-core:
+    python benchmarks/bench_sensor_resilience.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_framework import (  # noqa: E402
+    CustomerBehaviorSensor,
+    MarketDataSensor,
+    Sensor,
+    SensorResilience,
+)
+
+CYCLES = 300
+BASE_LATENCY = 0.005
+SLOW_TAIL_PROBABILITY = 0.03
+SLOW_TAIL_LATENCY = 0.15
+STALL_PROBABILITY = 0.05
+STALL_LATENCY = 0.4
+FAILURE_WINDOW = (CYCLES // 3, 2 * CYCLES // 3)
+FAILURE_LATENCY = 0.1
+
+
+class FakeMarketApi:
+    """Market data upstream with per-symbol slow tails, stalls and an outage window"""
+
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self.cycle = 0
+        self.calls = 0
+
+    async def get_market_data(self, symbol: str) -> Dict[str, Any]:
+        self.calls += 1
+        latency = BASE_LATENCY * self.rng.lognormal(0.0, 0.3)
+        if self.rng.random() < SLOW_TAIL_PROBABILITY:
+            latency = SLOW_TAIL_LATENCY
+        if symbol == 'MSFT' and self.rng.random() < STALL_PROBABILITY:
+            latency = STALL_LATENCY
+
+        if symbol == 'GOOGL' and FAILURE_WINDOW[0] <= self.cycle < FAILURE_WINDOW[1]:
+            await asyncio.sleep(FAILURE_LATENCY)
+            raise ConnectionError("upstream unavailable")
+
+        await asyncio.sleep(latency)
+        return {'symbol': symbol, 'volatility': 0.02, 'demand_trend': 1.0}
+
+
+class FakeAnalyticsApi:
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+
+    async def get_customer_metrics(self) -> Dict[str, Any]:
+        latency = BASE_LATENCY * self.rng.lognormal(0.0, 0.3)
+        if self.rng.random() < SLOW_TAIL_PROBABILITY:
+            latency = SLOW_TAIL_LATENCY
+        await asyncio.sleep(latency)
+        return {'price_elasticity': -1.0}
+
+
+async def run(resilience: Optional[SensorResilience]) -> Dict[str, Any]:
+    rng = np.random.default_rng(3)
+    market_api = FakeMarketApi(rng)
+    sensors: List[Sensor] = [
+        MarketDataSensor(['AAPL', 'MSFT', 'GOOGL'], market_api, resilience=resilience),
+        CustomerBehaviorSensor(FakeAnalyticsApi(rng), resilience=resilience),
+    ]
+
+    latencies = []
+    observations = 0
+    stale = 0
+    for cycle in range(CYCLES):
+        market_api.cycle = cycle
+        start = time.perf_counter()
+        # Same fan-out as OODAAgent.observe
+        results = await asyncio.gather(*(sensor.collect() for sensor in sensors), return_exceptions=True)
+        latencies.append(time.perf_counter() - start)
+
+        for result in results:
+            if isinstance(result, Exception):
+                continue
+            observations += len(result)
+            stale += sum(1 for obs in result if obs.metadata.get('stale'))
+
+    latencies = np.array(latencies) * 1e3
+    return {
+        'p50': np.percentile(latencies, 50),
+        'p95': np.percentile(latencies, 95),
+        'p99': np.percentile(latencies, 99),
+        'observations': observations,
+        'stale': stale,
+        'upstream_calls': market_api.calls,
+    }
+
+
+def report(label: str, stats: Dict[str, Any]) -> None:
+    print(f"{label:<22}{stats['p50']:>9.1f}{stats['p95']:>9.1f}{stats['p99']:>9.1f}"
+          f"{stats['observations']:>8}{stats['stale']:>8}{stats['upstream_calls']:>13}")
+
+
+async def main() -> None:
+    # Upstream failures are expected here; keep the report readable
+    logging.disable(logging.ERROR)
+
+    print(f"{CYCLES} observe cycles, latencies in ms")
+    print(f"{'':<22}{'p50':>9}{'p95':>9}{'p99':>9}{'obs':>8}{'stale':>8}{'market calls':>13}")
+    report("baseline", await run(None))
+    resilience = SensorResilience(timeout=0.25, failure_threshold=3, reset_timeout=0.5)
+    report("resilient", await run(resilience))
+
+    print("\nper-source state after resilient run")
+    for source, stats in resilience.get_source_stats().items():
+        print(f"  {source:<20} p95={stats['p95_latency'] * 1e3:6.1f}ms "
+              f"hedges={stats['hedges_issued']}/{stats['requests_issued']:<4} circuit={stats['circuit_state']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
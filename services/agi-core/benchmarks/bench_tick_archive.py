@@ -0,0 +1,165 @@
+"""
+Benchmark: tick archive ingest and range queries vs the Redis observation path
+
+Generates a month of synthetic ticks for several symbols, bulk-ingests them
+into a TickArchive, then times range queries of different widths (zero-copy
+per-day slices and concatenated arrays). Also times ingest through
+AgentMemory.store_observation/spill, and, when a Redis server is reachable
+(REDIS_URL, default redis://localhost:6379/15), the existing Redis
+store_observation and retrieve_recent_observations path on a sample.
+
+Run from services/agi-core:
+    python benchmarks/bench_tick_archive.py
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+
+import numpy as np
+import redis
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_framework import AgentMemory, Observation, TickArchive  # noqa: E402
+
+SYMBOLS = [f"market_data_SYM{i}" for i in range(5)]
+DAYS = 30
+TICK_SECONDS = 5
+START = datetime(2024, 1, 1)
+OBJECT_SAMPLE = 20_000
+REDIS_SAMPLE = 20_000
+QUERY_REPEATS = 50
+
+
+class _NullRedis:
+    """Stands in for Redis when only the archive spill path is being timed"""
+
+    def setex(self, *args) -> None:
+        pass
+
+
+def make_month(symbol_index: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(symbol_index)
+    n = DAYS * 86400 // TICK_SECONDS
+    timestamps = np.datetime64(START, 'ns') + np.arange(n) * np.timedelta64(TICK_SECONDS, 's')
+    return {
+        'timestamp': timestamps,
+        'price': 100 * np.exp(np.cumsum(rng.normal(0, 1e-4, n))),
+        'volume': rng.poisson(500, n).astype(np.float64),
+        'volatility': np.abs(rng.normal(0.03, 0.01, n)),
+        'demand_trend': rng.normal(1.0, 0.05, n),
+        'default_rate': np.abs(rng.normal(0.02, 0.01, n)),
+        'confidence': np.full(n, 0.95),
+    }
+
+
+def make_observations(n: int) -> list:
+    rng = np.random.default_rng(99)
+    return [
+        Observation(
+            timestamp=START + timedelta(seconds=TICK_SECONDS * i),
+            source=SYMBOLS[0],
+            data_type="financial",
+            raw_data={'price': float(100 + rng.normal()), 'volume': 500.0, 'volatility': 0.03},
+            confidence=0.95
+        )
+        for i in range(n)
+    ]
+
+
+def time_queries(archive: TickArchive, width: timedelta) -> Dict[str, float]:
+    rng = np.random.default_rng(5)
+    span = DAYS * 86400 - width.total_seconds()
+    slices_time = concat_time = 0.0
+    rows = 0
+    for _ in range(QUERY_REPEATS):
+        start = START + timedelta(seconds=float(rng.uniform(0, span)))
+        symbol = SYMBOLS[rng.integers(len(SYMBOLS))]
+
+        t0 = time.perf_counter()
+        slices = archive.query_segments(symbol, start, start + width, fields=('price', 'volume'))
+        slices_time += time.perf_counter() - t0
+        rows += sum(len(s) for s in slices)
+
+        t0 = time.perf_counter()
+        arrays = archive.query(symbol, start, start + width, fields=('price', 'volume'))
+        float(arrays['price'].mean())
+        concat_time += time.perf_counter() - t0
+
+    return {
+        'slices_ms': slices_time / QUERY_REPEATS * 1e3,
+        'concat_ms': concat_time / QUERY_REPEATS * 1e3,
+        'rows': rows / QUERY_REPEATS,
+    }
+
+
+def bench_redis(observations: list) -> None:
+    url = os.environ.get('REDIS_URL', 'redis://localhost:6379/15')
+    client = redis.Redis.from_url(url)
+    try:
+        client.ping()
+    except redis.exceptions.ConnectionError:
+        print(f"\nRedis path: skipped (no server at {url})")
+        return
+
+    client.flushdb()
+    memory = AgentMemory(client)
+    t0 = time.perf_counter()
+    for obs in observations:
+        memory.store_observation(obs)
+    ingest = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    recent = memory.retrieve_recent_observations(hours=24 * 365 * 10)
+    query = time.perf_counter() - t0
+    client.flushdb()
+
+    print(f"\nRedis path ({len(observations):,} observations)")
+    print(f"  ingest:          {len(observations) / ingest:>14,.0f} ticks/s")
+    print(f"  range query:     {query * 1e3:>14.1f} ms for {len(recent):,} rows (full key scan)")
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    root = tempfile.mkdtemp(prefix="tick_archive_")
+    try:
+        archive = TickArchive(root)
+        months = [make_month(i) for i in range(len(SYMBOLS))]
+        total = sum(len(m['timestamp']) for m in months)
+
+        t0 = time.perf_counter()
+        for symbol, month in zip(SYMBOLS, months):
+            archive.append(symbol, month['timestamp'], month)
+        bulk_ingest = time.perf_counter() - t0
+
+        observations = make_observations(OBJECT_SAMPLE)
+        memory = AgentMemory(_NullRedis(), tick_archive=TickArchive(os.path.join(root, "spill")))
+        t0 = time.perf_counter()
+        for obs in observations:
+            memory.store_observation(obs)
+        memory.spill()
+        spill_ingest = time.perf_counter() - t0
+
+        print(f"Tick archive: {len(SYMBOLS)} symbols x {DAYS} days at {TICK_SECONDS}s ({total:,} ticks)")
+        print(f"  bulk ingest:     {total / bulk_ingest:>14,.0f} ticks/s")
+        print(f"  spill ingest:    {len(observations) / spill_ingest:>14,.0f} ticks/s (AgentMemory, per observation)")
+        print(f"  {'range':<10}{'rows':>10}{'slices (ms)':>14}{'arrays (ms)':>14}")
+        for label, width in (("1 hour", timedelta(hours=1)), ("1 day", timedelta(days=1)),
+                             ("1 week", timedelta(days=7)), ("1 month", timedelta(days=DAYS - 1))):
+            result = time_queries(archive, width)
+            print(f"  {label:<10}{result['rows']:>10,.0f}{result['slices_ms']:>14.3f}{result['concat_ms']:>14.3f}")
+
+        bench_redis(make_observations(REDIS_SAMPLE))
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
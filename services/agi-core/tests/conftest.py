@@ -0,0 +1,5 @@
+import os
+import sys
+
+# agi-core is not an installable package; import agentic_framework from the service directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
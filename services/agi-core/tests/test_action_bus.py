@@ -0,0 +1,163 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from agentic_framework import (
+    ActionBus,
+    ActionExecutor,
+    ActionRequest,
+    Decision,
+    DynamicPricingAgent,
+    SimulatedActionExecutor,
+    Situation,
+)
+
+
+class RecordingExecutor(ActionExecutor):
+    def __init__(self, fail: bool = False, drop_results: int = 0):
+        self.fail = fail
+        self.drop_results = drop_results
+        self.batches: List[List[ActionRequest]] = []
+
+    async def execute_batch(self, requests: List[ActionRequest]) -> List[Dict[str, Any]]:
+        self.batches.append(requests)
+        if self.fail:
+            raise ConnectionError("downstream unavailable")
+        results = [{'success': True, 'applied': r.parameters['change']} for r in requests]
+        return results[:len(results) - self.drop_results]
+
+    @property
+    def applied(self) -> List[float]:
+        return [r.parameters['change'] for batch in self.batches for r in batch]
+
+
+def _request(change: float, coalesce_key: str = "pricing:all") -> ActionRequest:
+    return ActionRequest(target="pricing", action_type="adjust_pricing", parameters={'change': change},
+                         agent_id="agent", coalesce_key=coalesce_key)
+
+
+def _bus(executor: ActionExecutor) -> ActionBus:
+    bus = ActionBus(batch_window=0.01)
+    bus.register_executor("pricing", executor)
+    return bus
+
+
+def test_pending_requests_coalesce_to_latest():
+    executor = RecordingExecutor()
+    bus = _bus(executor)
+
+    async def scenario():
+        return await asyncio.gather(bus.submit(_request(5)), bus.submit(_request(-2)),
+                                    bus.submit(_request(1, "pricing:grocery")))
+
+    first, second, other = asyncio.run(scenario())
+    assert executor.applied == [-2, 1]
+    assert first == {'success': False, 'status': 'superseded', 'superseded_by': first['superseded_by']}
+    assert second == {'success': True, 'applied': -2}
+    assert other['applied'] == 1
+
+
+def test_identical_latest_request_is_deduplicated():
+    executor = RecordingExecutor()
+    bus = _bus(executor)
+
+    async def scenario():
+        await bus.submit(_request(5))
+        return await bus.submit(_request(5))
+
+    assert asyncio.run(scenario())['applied'] == 5
+    assert executor.applied == [5]
+    assert bus.stats['deduplicated'] == 1
+
+
+@pytest.mark.parametrize("changes", [[5, -2, 5], [3, -1, 3]])
+def test_request_after_override_is_applied_again(changes):
+    executor = RecordingExecutor()
+    bus = _bus(executor)
+
+    async def scenario():
+        for change in changes:
+            await bus.submit(_request(change))
+
+    asyncio.run(scenario())
+    assert executor.applied == changes
+    assert bus.stats['deduplicated'] == 0
+
+
+def test_superseded_request_is_not_deduplicated():
+    executor = RecordingExecutor()
+    bus = _bus(executor)
+
+    async def scenario():
+        await asyncio.gather(bus.submit(_request(5)), bus.submit(_request(-2)))
+        return await bus.submit(_request(5))
+
+    assert asyncio.run(scenario()) == {'success': True, 'applied': 5}
+    assert executor.applied == [-2, 5]
+
+
+def test_failed_batch_fails_callers_and_allows_retry():
+    executor = RecordingExecutor(fail=True)
+    bus = _bus(executor)
+
+    async def scenario():
+        with pytest.raises(ConnectionError):
+            await bus.submit(_request(5))
+        executor.fail = False
+        return await bus.submit(_request(5))
+
+    assert asyncio.run(scenario())['applied'] == 5
+    assert len(executor.batches) == 2
+
+
+def test_result_count_mismatch_fails_every_caller():
+    executor = RecordingExecutor(drop_results=1)
+    bus = _bus(executor)
+
+    async def scenario():
+        return await asyncio.wait_for(
+            asyncio.gather(bus.submit(_request(5, "a")), bus.submit(_request(1, "b")), return_exceptions=True),
+            timeout=1.0
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not bus._recent
+
+
+def test_coalesce_index_expires_with_dedup_entries():
+    bus = _bus(RecordingExecutor())
+
+    async def scenario():
+        await bus.submit(_request(5, "a"))
+        await bus.submit(_request(1, "b"))
+
+    asyncio.run(scenario())
+    assert set(bus._latest_by_coalesce_key) == {("pricing", "a"), ("pricing", "b")}
+
+    bus._expire_recent(time.monotonic() + bus.dedup_ttl)
+    assert not bus._latest_by_coalesce_key
+    assert not bus._recent
+
+
+def test_agent_records_superseded_action_as_not_applied():
+    bus = ActionBus(batch_window=0.01)
+    bus.register_executor("pricing_system", SimulatedActionExecutor(DynamicPricingAgent.apply_pricing_action))
+    agent = DynamicPricingAgent("pricing", sensors=[], memory=None, action_bus=bus)
+    situation = Situation(timestamp=datetime.now(), observations=[], context={})
+
+    def decision(change: float) -> Decision:
+        return Decision(timestamp=datetime.now(), situation=situation, action_type="adjust_pricing",
+                        parameters={'price_adjustment_percent': change, 'affected_products': ['all'],
+                                    'duration_hours': 24},
+                        expected_outcome="", confidence=0.8, risk_score=0.1, reasoning="")
+
+    async def scenario():
+        return await asyncio.gather(agent.act(decision(0.05)), agent.act(decision(-0.02)))
+
+    superseded, applied = asyncio.run(scenario())
+    assert superseded.status == "superseded" and not superseded.result['success']
+    assert applied.status == "completed" and applied.result['success']
@@ -0,0 +1,76 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from agentic_framework import AgentOrchestrator, PortfolioRiskEngine, PortfolioSnapshot, RiskAssessmentAgent
+
+
+def _snapshot(periods: int, positions: int = 30) -> PortfolioSnapshot:
+    rng = np.random.default_rng(1)
+    return PortfolioSnapshot(
+        exposures=rng.normal(1e4, 1e3, positions),
+        returns_history=rng.normal(0, 0.01, (periods, positions)),
+        groups=rng.integers(0, 3, positions),
+        group_names=['a', 'b', 'c']
+    )
+
+
+def test_short_history_skips_monte_carlo():
+    engine = PortfolioRiskEngine(n_scenarios=1000, max_workers=1, seed=1)
+    report = engine.assess(_snapshot(periods=1))
+
+    assert report['monte_carlo_skipped'] == 'insufficient_history'
+    assert 'monte_carlo_var_99' not in report
+    assert np.isfinite(report['historical_var_99'])
+    with pytest.raises(ValueError):
+        engine.monte_carlo_pnl(_snapshot(periods=5))
+
+
+def _count_fits(engine: PortfolioRiskEngine, monkeypatch) -> list:
+    fits = []
+    fit = engine.fit_factor_model
+    monkeypatch.setattr(engine, 'fit_factor_model', lambda history: fits.append(history) or fit(history))
+    return fits
+
+
+def test_factor_model_is_fitted_once_per_portfolio_update(monkeypatch):
+    engine = PortfolioRiskEngine(n_scenarios=1000, max_workers=1, seed=1)
+    fits = _count_fits(engine, monkeypatch)
+    agent = RiskAssessmentAgent("risk", sensors=[], memory=None, risk_engine=engine)
+    snapshot = _snapshot(periods=60)
+
+    agent.update_portfolio(snapshot)
+    first = engine.assess(agent.portfolio)
+    second = engine.assess(agent.portfolio)
+    assert len(fits) == 1
+    assert first['monte_carlo_var_99'] == second['monte_carlo_var_99']
+
+    # The agent holds a copy, so in-place edits need another update to take effect
+    snapshot.returns_history *= 3
+    assert engine.assess(agent.portfolio)['monte_carlo_var_99'] == first['monte_carlo_var_99']
+    agent.update_portfolio(snapshot)
+    assert engine.assess(agent.portfolio)['monte_carlo_var_99'] > first['monte_carlo_var_99']
+    assert len(fits) == 2
+
+
+def test_writable_history_is_refitted_after_in_place_update(monkeypatch):
+    engine = PortfolioRiskEngine(n_scenarios=1000, max_workers=1, seed=1)
+    fits = _count_fits(engine, monkeypatch)
+    snapshot = _snapshot(periods=60)
+
+    first = engine.assess(snapshot)
+    snapshot.returns_history *= 3
+    assert engine.assess(snapshot)['monte_carlo_var_99'] > first['monte_carlo_var_99']
+    assert len(fits) == 2
+
+
+def test_pool_is_created_lazily_and_closed_on_shutdown():
+    engine = PortfolioRiskEngine(max_workers=2)
+    orchestrator = AgentOrchestrator(redis_client=None, db_engine=None)
+    orchestrator.register_agent(RiskAssessmentAgent("risk", sensors=[], memory=None, risk_engine=engine))
+    assert engine._pool is None
+
+    engine._get_pool()
+    asyncio.run(orchestrator.stop_orchestration())
+    assert engine._pool is None
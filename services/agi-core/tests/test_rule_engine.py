@@ -0,0 +1,95 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from agentic_framework import (
+    CompiledRuleSet,
+    Observation,
+    RiskAssessmentAgent,
+    RuleEngine,
+    ThresholdRule,
+)
+
+
+def _observation(data_type: str, **raw_data) -> Observation:
+    return Observation(timestamp=datetime.now(), source="test", data_type=data_type, raw_data=raw_data)
+
+
+def _credit_rule(**overrides) -> ThresholdRule:
+    spec = {'data_type': 'financial', 'field': 'default_rate', 'op': '>', 'threshold': 0.05,
+            'outcome': 'threat', 'label': 'elevated_default_risk', 'risk_domain': 'credit', 'severity': 0.5}
+    return ThresholdRule.from_dict({**spec, **overrides})
+
+
+def test_severity_is_static_without_critical_value():
+    rule = _credit_rule()
+
+    assert rule.severity_of(0.06) == 0.5
+    assert rule.severity_of(0.5) == 0.5
+
+
+def test_severity_rises_from_base_to_one_at_critical_value():
+    rule = _credit_rule(critical_value=0.1)
+
+    assert rule.severity_of(0.05) == 0.5
+    assert rule.severity_of(0.075) == pytest.approx(0.75)
+    assert rule.severity_of(0.2) == 1.0
+
+
+def test_threat_profile_reports_most_extreme_observed_value():
+    evaluation = CompiledRuleSet([_credit_rule(critical_value=0.1)]).evaluate([
+        _observation('financial', default_rate=0.06),
+        _observation('financial', default_rate=0.09),
+    ])
+
+    profile = evaluation.threat_profile['elevated_default_risk']
+    assert profile['observed_value'] == pytest.approx(0.09)
+    assert profile['severity'] == pytest.approx(0.9)
+
+
+@pytest.mark.parametrize("observation, expected", [
+    (_observation('financial', default_rate=0.06), "tighten_credit_policy"),
+    (_observation('operational', system_uptime=0.985), "activate_backup_systems"),
+    (_observation('financial', volatility=0.5), None),
+])
+def test_default_risk_rules_escalate_as_before(observation, expected):
+    agent = RiskAssessmentAgent("risk", sensors=[], memory=None)
+    situation = asyncio.run(agent.orient([observation]))
+
+    assert situation.threats
+    decision = asyncio.run(agent.decide(situation))
+    assert (decision.action_type if decision else None) == expected
+
+
+def _write_rules(path: str, threshold: float, mtime: float) -> None:
+    with open(path, "w") as config_file:
+        json.dump({'rules': [{'data_type': 'financial', 'field': 'volatility', 'op': '>',
+                              'threshold': threshold, 'outcome': 'threat', 'label': 'volatile'}]}, config_file)
+    os.utime(path, (mtime, mtime))
+
+
+def test_hot_reload_picks_up_edited_config(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write_rules(path, threshold=0.5, mtime=1_000_000)
+    engine = RuleEngine(config_path=path)
+    observations = [_observation('financial', volatility=0.3)]
+    assert engine.evaluate(observations).threats == []
+
+    _write_rules(path, threshold=0.2, mtime=1_000_010)
+    assert engine.evaluate(observations).threats == ['volatile']
+
+
+def test_hot_reload_keeps_previous_rules_when_config_is_broken(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write_rules(path, threshold=0.2, mtime=1_000_000)
+    engine = RuleEngine(config_path=path)
+
+    with open(path, "w") as config_file:
+        config_file.write('{"rules": [')
+    os.utime(path, (1_000_010, 1_000_010))
+
+    assert not engine.reload_if_changed()
+    assert engine.evaluate([_observation('financial', volatility=0.3)]).threats == ['volatile']
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from agentic_framework import AdaptiveSchedulingPolicy, AgentPriority, AgentStatus, OODAAgent, Situation
+
+
+class IdleAgent(OODAAgent):
+    def __init__(self, priority: AgentPriority):
+        super().__init__("agent", "agent", "test", sensors=[], memory=None, priority=priority)
+        self.status = AgentStatus.ACTIVE
+        self.last_situation = Situation(timestamp=datetime.now(), observations=[], context={})
+
+    async def orient(self, observations):
+        raise NotImplementedError
+
+    async def decide(self, situation):
+        raise NotImplementedError
+
+    async def act(self, decision):
+        raise NotImplementedError
+
+
+def _schedule(interval: float) -> dict:
+    return {'interval': interval, 'effective_interval': interval, 'idle_streak': 0}
+
+
+def test_idle_low_priority_agent_backs_off_up_to_cap():
+    policy = AdaptiveSchedulingPolicy(max_backoff_multiplier=4.0)
+    agent, schedule = IdleAgent(AgentPriority.LOW), _schedule(60)
+
+    intervals = []
+    for _ in range(4):
+        policy.record_execution(agent, schedule)
+        intervals.append(schedule['effective_interval'])
+
+    assert intervals == [120, 240, 240, 240]
+
+
+def test_critical_agent_never_backs_off():
+    policy = AdaptiveSchedulingPolicy()
+    agent, schedule = IdleAgent(AgentPriority.CRITICAL), _schedule(600)
+
+    for _ in range(5):
+        policy.record_execution(agent, schedule)
+
+    assert schedule['effective_interval'] == 600
+
+
+def test_threat_shortens_critical_interval():
+    policy = AdaptiveSchedulingPolicy(critical_threat_factor=0.2, min_interval=5.0)
+    agent, schedule = IdleAgent(AgentPriority.CRITICAL), _schedule(600)
+    agent.last_situation.threats = ["high_market_volatility"]
+
+    policy.record_execution(agent, schedule)
+
+    assert schedule['effective_interval'] == 120
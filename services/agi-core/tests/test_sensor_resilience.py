@@ -0,0 +1,120 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from agentic_framework import CircuitState, MarketDataSensor, Observation, RiskAssessmentAgent, SensorResilience
+
+
+def _observation(confidence: float = 1.0) -> Observation:
+    return Observation(timestamp=datetime.now(), source="src", data_type="financial",
+                       raw_data={'price': 1.0}, confidence=confidence)
+
+
+def _fetch(latency: float, fail: bool = False):
+    async def fetch() -> Observation:
+        await asyncio.sleep(latency)
+        if fail:
+            raise ConnectionError("upstream unavailable")
+        return _observation()
+    return fetch
+
+
+def test_cancelled_half_open_probe_reopens_breaker():
+    resilience = SensorResilience(failure_threshold=1, reset_timeout=0.0)
+
+    async def scenario():
+        await resilience.observe("src", _fetch(0, fail=True))
+        probe = asyncio.ensure_future(resilience.observe("src", _fetch(1.0)))
+        await asyncio.sleep(0.01)
+        assert resilience.breakers["src"].state == CircuitState.HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(scenario())
+    assert resilience.breakers["src"].state == CircuitState.OPEN
+
+
+def test_fallback_confidence_decays_and_expires():
+    resilience = SensorResilience(max_staleness=100.0)
+
+    async def scenario():
+        await resilience.observe("src", _fetch(0))
+        stored_at, last = resilience.last_good["src"]
+
+        resilience.last_good["src"] = (stored_at - 50.0, last)
+        half_life = await resilience.observe("src", _fetch(0, fail=True))
+
+        resilience.last_good["src"] = (time.monotonic() - 101.0, last)
+        expired = await resilience.observe("src", _fetch(0, fail=True))
+        return half_life, expired
+
+    half_life, expired = asyncio.run(scenario())
+    assert half_life.metadata['stale']
+    assert half_life.confidence == pytest.approx(0.5 * 0.5, rel=0.01)
+    assert expired is None
+
+
+def test_hedges_respect_budget_and_sample_primary_latency():
+    resilience = SensorResilience(min_samples=1, min_hedge_delay=0.001, hedge_budget=0.1, timeout=1.0)
+    primaries = set()
+
+    async def fetch() -> Observation:
+        # The first call of each request is slow; a hedge for it answers immediately
+        request = resilience.requests_issued["src"]
+        is_primary = request not in primaries
+        primaries.add(request)
+        await asyncio.sleep(0.05 if is_primary else 0.0)
+        return _observation()
+
+    async def scenario():
+        resilience._source_state("src")[0].record(0.001)
+        for _ in range(40):
+            await resilience.observe("src", fetch)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert resilience.hedges_issued["src"] <= 0.1 * resilience.requests_issued["src"]
+    # Slow primaries are sampled even when a hedge answered first
+    assert resilience.latencies["src"].percentile(95) >= 0.04
+
+
+class FlakyMarketApi:
+    """Answers once with a high default rate, then fails"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_market_data(self, symbol):
+        self.calls += 1
+        if self.calls > 1:
+            raise ConnectionError("upstream unavailable")
+        return {'symbol': symbol, 'default_rate': 0.08}
+
+
+class RecordingMemory:
+    def __init__(self):
+        self.stored = []
+
+    def store_observation(self, observation):
+        self.stored.append(observation)
+
+
+def test_stale_fallbacks_are_neither_stored_nor_evaluated():
+    memory = RecordingMemory()
+    sensor = MarketDataSensor(['AAPL'], FlakyMarketApi(), resilience=SensorResilience())
+    agent = RiskAssessmentAgent("risk", sensors=[sensor], memory=memory)
+
+    async def cycle():
+        observations = await agent.observe()
+        return observations, await agent.orient(observations)
+
+    fresh, fresh_situation = asyncio.run(cycle())
+    stale, stale_situation = asyncio.run(cycle())
+
+    assert fresh_situation.threats == ['elevated_default_risk']
+    assert stale[0].metadata['stale']
+    assert stale_situation.threats == []
+    assert memory.stored == fresh
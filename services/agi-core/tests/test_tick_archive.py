@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agentic_framework import AgentMemory, AgentOrchestrator, Observation, OODAAgent, TickArchive
+
+START = datetime(2024, 1, 1, 9)
+
+
+class NullRedis:
+    def setex(self, *args) -> None:
+        pass
+
+
+def _observation(seconds: int, source: str = "market_data_AAPL") -> Observation:
+    return Observation(timestamp=START + timedelta(seconds=seconds), source=source, data_type="financial",
+                       raw_data={'price': float(seconds)})
+
+
+def _prices(memory: AgentMemory, source: str = "market_data_AAPL") -> list:
+    slices = memory.query_history(source, START, START + timedelta(hours=1), fields=('price',))
+    return [float(p) for s in slices for p in s.columns['price']]
+
+
+def test_archive_rejects_late_ticks_unless_dropping(tmp_path):
+    archive = TickArchive(str(tmp_path))
+    stamps = np.array([START + timedelta(seconds=s) for s in (10, 20)], dtype='datetime64[ns]')
+    archive.append("AAPL", stamps, {'price': np.array([1.0, 2.0])})
+
+    late = np.array([START + timedelta(seconds=s) for s in (5, 15, 30)], dtype='datetime64[ns]')
+    with pytest.raises(ValueError):
+        archive.append("AAPL", late, {'price': np.array([0.5, 1.5, 3.0])})
+    assert archive.append("AAPL", late, {'price': np.array([0.5, 1.5, 3.0])}, drop_late=True) == 1
+
+
+def test_late_tick_only_drops_itself(tmp_path):
+    memory = AgentMemory(NullRedis(), tick_archive=TickArchive(str(tmp_path)), spill_batch_size=2)
+    for seconds in (10, 20):
+        memory.store_observation(_observation(seconds))
+    memory.spill()
+
+    for obs in (_observation(5), _observation(30), _observation(40, "market_data_MSFT")):
+        memory.store_observation(obs)
+    memory.spill()
+
+    assert _prices(memory) == [10.0, 20.0, 30.0]
+    assert _prices(memory, "market_data_MSFT") == [40.0]
+    assert memory.spill_stats == {'written': 4, 'late_dropped': 1, 'failed': 0}
+    memory.close()
+
+
+def test_repeated_timestamps_are_not_archived_twice(tmp_path):
+    memory = AgentMemory(NullRedis(), tick_archive=TickArchive(str(tmp_path)))
+    for _ in range(4):
+        memory.store_observation(_observation(10))
+        memory.spill()
+
+    assert _prices(memory) == [10.0]
+    assert memory.spill_stats['late_dropped'] == 3
+    memory.close()
+
+
+def test_buffer_is_flushed_after_spill_interval(tmp_path):
+    memory = AgentMemory(NullRedis(), tick_archive=TickArchive(str(tmp_path)), spill_interval=0.05)
+
+    async def scenario():
+        memory.store_observation(_observation(10))
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    memory._spill_executor.submit(lambda: None).result()
+    assert memory.spill_stats['written'] == 1
+    memory.close()
+
+
+class ArchivingAgent(OODAAgent):
+    async def orient(self, observations):
+        raise NotImplementedError
+
+    async def decide(self, situation):
+        raise NotImplementedError
+
+    async def act(self, decision):
+        raise NotImplementedError
+
+
+def test_orchestrator_shutdown_flushes_buffered_history(tmp_path):
+    memory = AgentMemory(NullRedis(), tick_archive=TickArchive(str(tmp_path)))
+    orchestrator = AgentOrchestrator(redis_client=None, db_engine=None)
+    orchestrator.register_agent(ArchivingAgent("agent", "agent", "test", sensors=[], memory=memory))
+    memory.store_observation(_observation(10))
+
+    asyncio.run(orchestrator.stop_orchestration())
+
+    archive = TickArchive(str(tmp_path))
+    assert list(archive.query("market_data_AAPL", START, START + timedelta(hours=1))['price']) == [10.0]
+    memory.close()